@@ -31,6 +31,13 @@ import (
 	"github.com/google/osv-scalibr/log"
 )
 
+// Regex expressions used for checking the ssh version, configs and history files.
+var (
+	reOpenSSHVersion = regexp.MustCompile(`OpenSSH_([^,]+),`)
+	reForwardAgent   = regexp.MustCompile(`^forwardagent\s+yes`)
+	reSSHAgentFwd    = regexp.MustCompile(`ssh (.* )?-\w*A`)
+)
+
 // Detector is a SCALIBR Detector for CVE-2023-38408.
 type Detector struct{}
 
@@ -82,8 +89,7 @@ func (d Detector) Scan(ctx context.Context, scanRoot string, ix *inventoryindex.
 	// 4. check bash history
 	historyLocations := []fileLocations{}
 	for _, path := range findHistoryFiles() {
-		re := regexp.MustCompile(`ssh (.* )?-\w*A`)
-		ls := findString(path, re)
+		ls := findString(path, reSSHAgentFwd)
 		log.Debugf("history file: %q %v %v", path, ls)
 		if len(ls) > 0 {
 			historyLocations = append(historyLocations, fileLocations{Path: path, LineNumbers: ls})
@@ -128,8 +134,7 @@ func getOpenSSHVersion() string {
 		return ""
 	}
 
-	re := regexp.MustCompile(`OpenSSH_([^,]+),`)
-	matches := re.FindStringSubmatch(string(out))
+	matches := reOpenSSHVersion.FindStringSubmatch(string(out))
 	if len(matches) >= 2 {
 		return matches[1]
 	}
@@ -186,7 +191,6 @@ func sshConfigContainsForward(path string) []int {
 
 	scanner := bufio.NewScanner(f)
 	scanner.Split(bufio.ScanLines)
-	reForwardAgent := regexp.MustCompile(`^forwardagent\s+yes`)
 	r := []int{}
 	i := -1
 	for scanner.Scan() {
@@ -29,6 +29,18 @@ import (
 	"github.com/google/osv-scalibr/stats"
 )
 
+// Regex expressions used for parsing requirements lines.
+var (
+	reComment                       = regexp.MustCompile(`(^|\s+)#.*$`)
+	reVersionRange                  = regexp.MustCompile(`\*|>|<|,`)
+	reWhiteSpace                    = regexp.MustCompile(`[ \t\r]`)
+	reValidPkg                      = regexp.MustCompile(`^\w(\w|-)+$`)
+	reExtras                        = regexp.MustCompile(`\[[^\[\]]*\]`)
+	reEnvVar                        = regexp.MustCompile(`(?P<var>\$\{(?P<name>[A-Z0-9_]+)\})`)
+	reTextAfterFirstOptionInclusive = regexp.MustCompile(`(?:--hash|--global-option|--config-settings|-C).*`)
+	reHashOption                    = regexp.MustCompile(`--hash=(.+?)(?:$|\s)`)
+)
+
 // Config is the configuration for the Extractor.
 type Config struct {
 	// Stats is a stats collector for reporting metrics.
@@ -188,7 +200,7 @@ func (e Extractor) extractFromInput(ctx context.Context, input *filesystem.ScanI
 
 // https://github.com/pypa/pip/blob/72a32e/src/pip/_internal/req/req_file.py#L492
 func removeComments(s string) string {
-	return regexp.MustCompile(`(^|\s+)#.*$`).ReplaceAllString(s, "")
+	return reComment.ReplaceAllString(s, "")
 }
 
 func getPinnedVersion(s string) (name, version string) {
@@ -207,11 +219,11 @@ func getPinnedVersion(s string) (name, version string) {
 }
 
 func isVersionRanges(s string) bool {
-	return regexp.MustCompile(`\*|>|<|,`).FindString(s) != ""
+	return reVersionRange.FindString(s) != ""
 }
 
 func removeWhiteSpaces(s string) string {
-	return regexp.MustCompile(`[ \t\r]`).ReplaceAllString(s, "")
+	return reWhiteSpace.ReplaceAllString(s, "")
 }
 
 func ignorePythonSpecifier(s string) string {
@@ -219,28 +231,26 @@ func ignorePythonSpecifier(s string) string {
 }
 
 func isValidPackage(s string) bool {
-	return regexp.MustCompile(`^\w(\w|-)+$`).MatchString(s)
+	return reValidPkg.MatchString(s)
 }
 
 func removeExtras(s string) string {
-	return regexp.MustCompile(`\[[^\[\]]*\]`).ReplaceAllString(s, "")
+	return reExtras.ReplaceAllString(s, "")
 }
 
 func hasEnvVariable(s string) bool {
-	return regexp.MustCompile(`(?P<var>\$\{(?P<name>[A-Z0-9_]+)\})`).FindString(s) != ""
+	return reEnvVar.FindString(s) != ""
 }
 
 // splitPerRequirementOptions removes from the input all text after the first per requirement option
 // and returns the remaining input along with the values of the --hash options. See the documentation
 // in https://pip.pypa.io/en/stable/reference/requirements-file-format/#per-requirement-options.
 func splitPerRequirementOptions(s string) (string, []string) {
-	textAfterFirstOptionInclusive := regexp.MustCompile(`(?:--hash|--global-option|--config-settings|-C).*`)
-	hashOption := regexp.MustCompile(`--hash=(.+?)(?:$|\s)`)
 	hashes := []string{}
-	for _, hashOptionMatch := range hashOption.FindAllStringSubmatch(s, -1) {
+	for _, hashOptionMatch := range reHashOption.FindAllStringSubmatch(s, -1) {
 		hashes = append(hashes, hashOptionMatch[1])
 	}
-	return textAfterFirstOptionInclusive.ReplaceAllString(s, ""), hashes
+	return reTextAfterFirstOptionInclusive.ReplaceAllString(s, ""), hashes
 }
 
 // ToPURL converts an inventory created by this extractor into a PURL.